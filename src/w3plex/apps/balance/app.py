@@ -17,7 +17,8 @@ from rich.text import Text
 from w3ext import Currency, CurrencyAmount, Account, Token, Chain
 from w3plex import application, apply_plugins
 from w3plex.utils import (
-    get_chains, get_config, get_services, get_context, execute_on_complete
+    get_chains, get_config, get_services, get_context, execute_on_complete,
+    is_erc_address,
 )
 from w3plex.utils.filter import AmountFilter, ChainFilter, join_filters, TokenLookup
 from w3plex.utils.loader import FileLoader
@@ -27,12 +28,6 @@ from w3plex.modules.debank import Debank
 empty = object()
 
 
-def is_erc_address(address: str) -> bool:
-    # ethereum address length is 20 bytes = 2 + 40 chars
-    address = address.strip()
-    return address.startswith('0x') and len(address) == 42
-
-
 async def balance_of(account: str, chain: Chain,
                      *tokens: List[Union[Currency, str]]) -> List[CurrencyAmount]:
     tokens = [token if isinstance(token, Currency)
@@ -1,5 +1,6 @@
 import asyncio
 import re
+import sys
 from collections import defaultdict
 from inspect import isclass
 from typing import Dict, Optional, Callable, Type, TypeVar, overload, Any, Union
@@ -24,7 +25,9 @@ COLLECTIONS = (
     ('conditions', Condition),
 )
 
-IMPORT_KEY = '__init__'
+_COLLECTION_NAMES = frozenset(name for name, _ in COLLECTIONS)
+
+IMPORT_KEY = sys.intern('__init__')
 IMPORT_SIGN = '$'
 
 
@@ -173,6 +176,9 @@ class ConfigTree(AttrDict):
     def __getattr__(self, name: str) -> Any:
         if name.startswith('get_'):
             collection = self._collections.get(name[4:])
+            if collection is None and name[4:] in _COLLECTION_NAMES:
+                # known sections missing in the config are just empty collections
+                collection = AttrDict()
             if collection is not None:
                 return lambda: collection
         return super().__getattr__(name)
@@ -8,30 +8,50 @@ import sys
 import textwrap
 from contextlib import contextmanager
 from functools import partial
-from types import MethodType
-from typing import Any, Dict, Optional, Tuple
+from types import MappingProxyType, MethodType
+from typing import Any, Callable, Dict, List, Mapping, Optional, Tuple
 
 from lazyplex import Application as _Application
 from lazyplex import create_context
 from ptpython.repl import embed
-from rich import print
-from rich.text import Text
 from ruamel.yaml import (
     dump as yaml_dump,
     load as yaml_load,
 )
 
 from .constants import CONTEXT_CHAINS_KEY, CONTEXT_SERVICES_KEY
-from .utils import AttrDict, load_path
-from .yaml import Dumper, Include, Loader
+from .utils import AttrDict, intern_keys, load_path
+from .yaml import Dumper, Include, Loader, load_mapping_keys
 from .core import config_loader, ConfigTree
+from .core.config import IMPORT_KEY
 
 logger = logging.getLogger(__name__)
 
 CHAINS_CONFIG_NAME = 'chains.yaml'
 DEFAULT_CONFIG_PATH = os.path.join(os.path.dirname(__file__), 'w3plex.yaml')
-APPLICATIONS_CFG_KEY = 'applications'
-ACTIONS_CFG_KEY = 'actions'
+APPLICATIONS_CFG_KEY = sys.intern('applications')
+ACTIONS_CFG_KEY = sys.intern('actions')
+
+_BANNER_TEMPLATE = textwrap.dedent("""
+    {sep}
+    W3plex interactive shell
+    The following variables are available:
+        - `apps`: all applications found in the config file.
+        {{ {fields} }}
+        - `cfg`: config loaded from the file {cfg_path}
+        - `services`: dictionary of loaded from config services
+        - `chains`: dictionary of loaded from config chains
+        - `tree`: resolved objects tree loaded from the config
+    {sep}
+""").strip()
+_CANCELLED_FMT = "%s cancelled\n"
+_CANCELLED_TTY_FMT = "\x1b[31m%s cancelled\x1b[0m\n"
+
+
+def _write_cancelled(subject: str):
+    # colorize only for terminals, so redirected output stays plain text
+    fmt = _CANCELLED_TTY_FMT if sys.stdout.isatty() else _CANCELLED_FMT
+    sys.stdout.write(fmt % subject)
 
 
 def _get_base_args_parse(*args, **kwargs) -> Tuple[argparse.ArgumentParser]:
@@ -46,21 +66,21 @@ def process_args():
     cfg_parser.add_argument('kwargs', nargs="*")
     cfg_args, _ = cfg_parser.parse_known_args()
 
-    cfg = load_config(cfg_args.config) if os.path.exists(cfg_args.config) else None
+    app_names = load_app_names(cfg_args.config) if os.path.exists(cfg_args.config) else None
 
     parser = _get_base_args_parse()
     actions = parser.add_subparsers(title="w3plex actions", required=False)
     init = actions.add_parser('init', description="Initialize a new config")
     init.set_defaults(func=init_cmd)
 
-    if cfg is not None:
+    if app_names is not None:
         shell = actions.add_parser('shell', description="Start w3ext shell for the current config")
-        shell.set_defaults(func=partial(run_shell_cmd, cfg=cfg))
+        shell.set_defaults(func=run_shell_cmd)
 
-        for app_name in cfg.get(APPLICATIONS_CFG_KEY, {}).keys():
+        for app_name in app_names:
             cmd = actions.add_parser(app_name, description=f"Run `{app_name}` application")
             cmd.add_argument("args", nargs='*', default=[], help="Single value or Key-value pairs separated by a comma. (e.g., value1 key2=value2)")
-            cmd.set_defaults(func=partial(run_app_cmd, name=app_name, cfg=cfg))
+            cmd.set_defaults(func=partial(run_app_cmd, name=app_name))
 
     args = parser.parse_args(" ".join(sys.argv[1:]).split(" "))
 
@@ -69,6 +89,17 @@ def process_args():
         return func(args)
 
 
+@contextmanager
+def _on_sigint(loop: asyncio.AbstractEventLoop, callback: Callable[[], Any]):
+    # a plain signal handler works on every platform and doesn't
+    # register anything within the loop, it only wakes the loop up
+    previous = signal.signal(signal.SIGINT, lambda *_: loop.call_soon_threadsafe(callback))
+    try:
+        yield
+    finally:
+        signal.signal(signal.SIGINT, previous)
+
+
 class _AppProxy:
     def __init__(self, app, runner) -> None:
         self.__app = app
@@ -85,11 +116,11 @@ class Shell:
     def __init__(self, args, cfg) -> None:
         self.args = args
         self.cfg = cfg
-        self.loop = asyncio.get_event_loop()
-        self.runner = Runner(self.loop)
+        # both are set up for the loop the shell is called within
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self.runner: Optional[Runner] = None
 
         self._active_tasks: set[asyncio.Future] = set()
-        self._main_task = None
 
     def _term_active_tasks(self):
         for task in self._active_tasks:
@@ -103,10 +134,13 @@ class Shell:
             finally:
                 await self.runner.finalize()
 
-        self.loop.add_signal_handler(signal.SIGINT, self._term_active_tasks)
         try:
-            self._main_task = asyncio.ensure_future(task())
-            self.loop.run_until_complete(self._main_task)
+            # the runner closes the loop and its default executor on exit
+            with asyncio.Runner() as arunner:
+                self.loop = arunner.get_loop()
+                self.runner = Runner(self.loop)
+                with _on_sigint(self.loop, self._term_active_tasks):
+                    arunner.run(task())
         except KeyboardInterrupt:
             pass
         except Exception as e:
@@ -116,26 +150,17 @@ class Shell:
         apps = self.runner.tree.get_applications()
 
         width, _ = os.get_terminal_size()
-        banner = textwrap.dedent(f"""
-            {"=" * (width)}
-            W3plex interactive shell
-            The following variables are available:
-                - `apps`: all applications found in the config file.
-                {{ {", ".join(set(apps.keys()))} }}
-                - `cfg`: config loaded from the file {self.args.config}
-                - `services`: dictionary of loaded from config services
-                - `chains`: dictionary of loaded from config chains
-                - `tree`: resolved objects tree loaded from the config
-            {"=" * width}
-        """).strip()
-        print(banner)
+        print(_BANNER_TEMPLATE.format(
+            sep="=" * width, fields=", ".join(apps), cfg_path=self.args.config
+        ))
 
         globals = {
             'app': apps,
-            'cfg': dict(self.cfg),
+            'cfg': self.cfg,
             'services': AttrDict(self.runner.tree.get_services()),
             'chains': AttrDict(self.runner.tree.get_chains()),
-            'tree': await config_loader.parse(self.cfg)
+            # the runner has already parsed the config, so reuse its tree
+            'tree': self.runner.tree,
         }
 
         async def eval_async(repl, text):
@@ -150,7 +175,7 @@ class Shell:
             try:
                 return await task
             except asyncio.CancelledError:
-                print(Text(f"`{text}` cancelled", "red"))
+                _write_cancelled(f"`{text}`")
             finally:
                 self._active_tasks.remove(task)
 
@@ -165,9 +190,12 @@ class Runner:
     cfg: Optional[Dict] = None
 
     _tree: Optional[ConfigTree] = None
+    _action_configs: Optional[Dict[str, Dict[str, Tuple[str, Dict]]]] = None
+    _shared_context: Optional[Dict[str, Mapping]] = None
 
-    def __init__(self, loop=None) -> None:
-        self.loop: asyncio.AbstractEventLoop = loop or asyncio.get_event_loop()
+    def __init__(self, loop: asyncio.AbstractEventLoop) -> None:
+        # the loop is owned and closed by the caller
+        self.loop = loop
 
     @property
     def is_initialized(self) -> bool:
@@ -196,7 +224,7 @@ class Runner:
             return _AppProxy(app, self)
 
         app_name = path.rsplit('.', 1)[-1]
-        if (app_module := cfg.get('__init__')) is None:
+        if (app_module := cfg.get(IMPORT_KEY)) is None:
             raise AttributeError(f"{app_name}: field `application` is required")
         apps = load_applications(app_module)
         if not len(apps):
@@ -213,60 +241,87 @@ class Runner:
         )(self.init_application)
 
         self._tree = await config_loader.parse(cfg)
+        self._action_configs = {}
+        self._shared_context = self._get_shared_context(cfg)
         self.cfg = cfg
 
     async def finalize(self):
         assert self.cfg is not None, "Not initialized, to be finilized"
 
         self.cfg = None
-        await asyncio.gather(*[
-            service.finalize() for service in self._tree.get_services().values()
-        ])
+        self._action_configs = None
+        self._shared_context = None
+        if (services := self._tree.get_services()):
+            await asyncio.gather(*[service.finalize() for service in services.values()])
+
+    def _get_shared_context(self, cfg: Dict) -> Dict[str, Mapping]:
+        # place w3plex import here to let main() function
+        # add appropriate package to the PATH
+        from w3plex.constants import CONTEXT_EXTRAS_KEY
+
+        return {
+            CONTEXT_EXTRAS_KEY: MappingProxyType({
+                key: value for key, value in cfg.items() if key != APPLICATIONS_CFG_KEY
+            }),
+            CONTEXT_CHAINS_KEY: MappingProxyType(self.tree.get_chains()),
+            CONTEXT_SERVICES_KEY: MappingProxyType(self.tree.get_services()),
+        }
 
     @contextmanager
     def _app_context(self, app: _Application):
         # place w3plex import here to let main() function
         # add appropriate package to the PATH
-        from w3plex.constants import CONTEXT_CONFIG_KEY, CONTEXT_EXTRAS_KEY
+        from w3plex.constants import CONTEXT_CONFIG_KEY
 
-        cfg = dict(self.cfg)
-        app_cfg = cfg.pop(APPLICATIONS_CFG_KEY).get(app.name)
+        app_cfg = self.cfg[APPLICATIONS_CFG_KEY].get(app.name)
+        # applications get read-only views, so nothing is copied per run
         with create_context({
-            CONTEXT_CONFIG_KEY: dict(app_cfg),
-            CONTEXT_EXTRAS_KEY: dict(cfg),
-            CONTEXT_CHAINS_KEY: dict(self.tree.get_chains()),
-            CONTEXT_SERVICES_KEY: dict(self.tree.get_services()),
+            CONTEXT_CONFIG_KEY: MappingProxyType(app_cfg),
+            **self._shared_context,
         }):
             self._extend_app_actions(app, app_cfg)
             yield app
 
+    def _get_action_configs(self, app_name: str, app_cfg: Dict) -> Dict[str, Tuple[str, Dict]]:
+        # config is static until the runner is finalized,
+        # so split actions' configs only once per application
+        actions = self._action_configs.get(app_name)
+        if actions is None:
+            actions = self._action_configs[app_name] = {}
+            for action_name, action_cfg in (app_cfg.get(ACTIONS_CFG_KEY) or {}).items():
+                action_cfg = dict(action_cfg or {})  # create a copy to modify it
+                actions[action_name] = (action_cfg.pop('action', None) or action_name, action_cfg)
+        return actions
+
     def _extend_app_actions(self, app: _Application, app_cfg: Dict):
-        for action_name, action_cfg in app_cfg.get(ACTIONS_CFG_KEY, {}).items():
-            action_cfg = dict(action_cfg)  # create a copy to modify it
-            action_base = action_cfg.pop('action', None) or action_name
-            app_action = app._actions.get(action_base)
+        actions = self._get_action_configs(app.name, app_cfg)
+        # collect new actions first, so app actions are updated at once
+        # and left untouched if any of config actions can't be bound
+        new_actions = {}
+        for action_name, (action_base, action_cfg) in actions.items():
+            # config actions may be based on the ones declared before them
+            app_action = new_actions.get(action_base) or app._actions.get(action_base)
             if app_action is None:
                 raise ValueError(f"Application '{app.name}' doesn't have any action, "
                                 f"that could be bound to config action '{action_name}'")
-            app._actions[action_name] = partial(app_action, config=action_cfg)
+            # cached config is shared between runs, so actions get a read-only view
+            new_actions[action_name] = partial(app_action, config=MappingProxyType(action_cfg))
+        app._actions.update(new_actions)
 
 
-def run_shell_cmd(args, *, cfg):
-    Shell(args, cfg)()
+def run_shell_cmd(args):
+    Shell(args, intern_keys(load_config(args.config)))()
 
 
-def run_app_cmd(args, *, name, cfg):
-    app_args, app_kwargs = [], {}
-    for item in getattr(args, 'args', []):
-        parts = item.split("=", 1)
-        if len(parts) == 1:
-            if (len(app_kwargs)):
-                raise AttributeError("A key=value argument cannot be followed by a positional argument.")
-            app_args.append(parts[0])
-        else:
-            app_kwargs[parts[0]] = parts[1]
-
-    runner = Runner()
+def run_app_cmd(args, *, name):
+    cfg = intern_keys(load_config(args.config))
+    items = getattr(args, 'args', [])
+    kw_start = next((i for i, item in enumerate(items) if "=" in item), len(items))
+    app_args = items[:kw_start]
+    pairs = [item.partition("=") for item in items[kw_start:]]
+    if not all(sep for _, sep, _ in pairs):
+        raise AttributeError("A key=value argument cannot be followed by a positional argument.")
+    app_kwargs = {key: value for key, _, value in pairs}
 
     coro = None
     async def command():
@@ -287,14 +342,13 @@ def run_app_cmd(args, *, name, cfg):
     def cancel_coro():
         coro.cancel()
 
-    runner.loop.add_signal_handler(signal.SIGINT, cancel_coro)
-
-    try:
-        runner.loop.run_until_complete(command())
-    except asyncio.CancelledError:
-        print(Text("Execution cancelled", "red"))
-    # hack to clean up loop resources, once execution completed
-    runner.loop.run_until_complete(asyncio.sleep(0))
+    with asyncio.Runner() as arunner:
+        runner = Runner(arunner.get_loop())
+        try:
+            with _on_sigint(runner.loop, cancel_coro):
+                arunner.run(command())
+        except asyncio.CancelledError:
+            _write_cancelled("Execution")
 
 
 def init_cmd(args):
@@ -317,6 +371,15 @@ def load_config(filename: str) -> Dict[str, Any]:
         return yaml_load(fr, Loader)
 
 
+def load_app_names(filename: str) -> List[str]:
+    try:
+        # only application names are required to build commands,
+        # so try not to parse the whole config
+        return load_mapping_keys(filename, APPLICATIONS_CFG_KEY)
+    except KeyError:
+        return list(((load_config(filename) or {}).get(APPLICATIONS_CFG_KEY) or {}).keys())
+
+
 def load_applications(name: str):
     loaded = load_path(name)
     if isinstance(loaded, _Application):
@@ -1,11 +1,16 @@
 import asyncio
-from contextlib import asynccontextmanager
+from typing import AsyncContextManager, List
 
 from loguru import logger
 
 from ..core import Service, EntityConfig
 
 
+def _read_proxies(filename: str) -> List[str]:
+    with open(filename, 'r') as fr:
+        return [proxy for line in fr if (proxy := line.strip())]
+
+
 class ProxiesConfig(EntityConfig):
     proxies: str
 
@@ -15,18 +20,31 @@ class ProxyService(Service[ProxiesConfig]):
 
     async def init(self):
         self._proxies = asyncio.Queue()
-        with open(self.config['proxies'], 'r') as fr:
-            for proxy in fr.readlines():
-                await self._proxies.put(proxy)
+        # read the file in a thread to not block other services' init
+        for proxy in await asyncio.to_thread(_read_proxies, self.config['proxies']):
+            # the queue is unbounded, so there's no need to await
+            self._proxies.put_nowait(proxy)
+
+    def get_proxy(self) -> AsyncContextManager[str]:
+        return _ProxyContext(self._proxies)
+
+
+class _ProxyContext:
+    """ Takes a proxy from the queue for the time of the context. """
+    __slots__ = ('_proxies', '_proxy')
+
+    def __init__(self, proxies: asyncio.Queue[str]) -> None:
+        self._proxies = proxies
+        self._proxy = None
 
-    @asynccontextmanager
-    async def get_proxy(self) -> str:
-        proxy = None
+    async def __aenter__(self) -> str:
         try:
-            if not self._proxies.qsize:
-                logger.debug("Waiting for proxy...")
-            proxy = await self._proxies.get()
-            yield proxy
-        finally:
-            if proxy is not None:
-                await self._proxies.put(proxy)
+            # usually there's a free proxy, so take it without any waiters' machinery
+            self._proxy = self._proxies.get_nowait()
+        except asyncio.QueueEmpty:
+            logger.debug("Waiting for proxy...")
+            self._proxy = await self._proxies.get()
+        return self._proxy
+
+    async def __aexit__(self, *exc_info) -> None:
+        self._proxies.put_nowait(self._proxy)
@@ -1,17 +1,53 @@
+import sys
+from typing import Any
+
+
+__all__ = [
+    'AttrDict', 'intern_keys',
+    'is_erc_address', 'is_erc_address_loose',
+    'is_erc_private_key', 'is_erc_private_key_loose',
+]
+
+
 class AttrDict(dict):
+    __slots__ = ()
+
     def __getattr__(self, name):
-        if name in self:
+        # called only if regular lookup failed, so there's no need to retry it
+        try:
             return self[name]
-        super().__getattribute__(name)
+        except KeyError:
+            raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}") from None
+
+
+def intern_keys(value: Any) -> Any:
+    """ Return a plain copy of the loaded config with all string keys interned. """
+    if isinstance(value, dict):
+        # round-trip loader keys may be str subclasses, that can't be interned
+        return {sys.intern(str(key)) if isinstance(key, str) else key: intern_keys(item)
+                for key, item in value.items()}
+    if isinstance(value, list):
+        return [intern_keys(item) for item in value]
+    return value
 
 
 def is_erc_address(address: str) -> bool:
+    """ Check the stripped string is an ethereum address. """
     # ethereum address length is 20 bytes = 2 + 40 chars
-    address = address.strip()
-    return address.startswith('0x') and len(address) == 42
+    return len(address) == 42 and address.startswith('0x')
+
+
+def is_erc_address_loose(address: str) -> bool:
+    """ Same as ``is_erc_address``, but surrounding whitespaces are allowed. """
+    return is_erc_address(address.strip())
 
 
 def is_erc_private_key(key: str) -> bool:
+    """ Check the stripped string is an erc private key. """
     # erc private key length is 32 bytes = 2 + 64 chars
-    key = key.strip()
-    return key.startswith('0x') and len(key) == 66
+    return len(key) == 66 and key.startswith('0x')
+
+
+def is_erc_private_key_loose(key: str) -> bool:
+    """ Same as ``is_erc_private_key``, but surrounding whitespaces are allowed. """
+    return is_erc_private_key(key.strip())
@@ -1,61 +1,129 @@
 import asyncio
+import operator
 import re
-from typing import Any, Optional, List, Callable, Tuple, Generic, TypeVar
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Any, Optional, List, Callable, Tuple, Generic, TypeVar, Pattern, Mapping, Iterable
 
 from w3ext import CurrencyAmount, Chain, Currency, TokenAmount, Contract
 
-WILDCARD = '*'
+try:
+    # linear time regexp engine, used for templates it supports
+    import re2
+except ImportError:
+    re2 = None
+else:
+    _RE2_OPTIONS = re2.Options()
+    # unsupported templates fall back to `re`, so there's nothing to report
+    _RE2_OPTIONS.log_errors = False
 
-T = TypeVar("T")
+WILDCARD = '*'
 
+_CONDITION_RE = re.compile(r"^\s*(<=|>=|==|!=|<|>)\s*(\$?)(.+?)\s*$")
+# constructs re2 reads differently, so templates using them stay with `re`:
+# \w, \d, \s and \b are ASCII-only in re2, `{,n}` is literal text there,
+# `[:` starts a POSIX class like `[[:alpha:]]`, and case-insensitive
+# matching folds some non-ASCII letters differently
+_RE_ONLY_SYNTAX_RE = re.compile(r"\\[wWdDsSbB]|\{,|\[:|\(\?[aiLmsux-]*i")
+_OPERATORS = {
+    '<': operator.lt,
+    '<=': operator.le,
+    '==': operator.eq,
+    '!=': operator.ne,
+    '>=': operator.ge,
+    '>': operator.gt,
+}
 
-def _filter(fn: Callable):
-    def apply_template(template: str):
-        def inner(*args, **kwargs) -> bool:
-            return fn(*args, **kwargs, template=template)
-        return inner
+T = TypeVar("T")
 
-    return apply_template
 
+def _always(*args, **kwargs) -> bool:
+    return True
 
-@_filter
-def _filter_chain(chain: Optional[Chain], *, template: str, **kwargs) -> bool:
-    if template == WILDCARD:
-        return True
-    return (chain is not None and
-            (chain.name == template or chain.chain_id == template))
 
+# Each filter factory takes a template and returns a filter bound to it,
+# so there's no extra call layer to pass the template on every check.
 
-@_filter
-def _filter_token(amount: CurrencyAmount, chain: Optional[Chain], *, template: str, **kwargs) -> bool:
+def _filter_chain(template: str):
     if template == WILDCARD:
-        return True
-    success = (amount.currency.name == template
-               or (chain and getattr(chain, template, None) == amount.currency))
-
-    if isinstance(amount, TokenAmount):
-        success = success or amount.currency.address.lower() == template.lower()
-
-    return success
-
-
-@_filter
-def _filter_amount(amount: CurrencyAmount, *, template: str, **kwargs) -> bool:
-    if (re.search(r";", template)):
-        raise ValueError(f"Unsafe filter found: `{template}`")
+        return _always
 
-    template, was_usd = re.subn(r"\$([\d.]+)", r"\1", template)
-    amount = amount.to_fixed() if not was_usd else getattr(amount, 'usd_price', 0)
+    def inner(chain: Optional[Chain] = None, **kwargs) -> bool:
+        return (chain is not None and
+                (chain.name == template or chain.chain_id == template))
+    return inner
 
-    # TODO: it might be unsafe, so maybe more checks should be added
-    return bool(eval(f"amount {template}", {}, {'amount': amount}))
 
-
-@_filter
-def _template_regexp_filter(line: str, *, template: str, **kwargs) -> bool:
+def _filter_token(template: str):
     if template == WILDCARD:
-        return True
-    return re.match(template, line) is not None
+        return _always
+    # amounts usually come grouped by chain, so keep the last chain's
+    # token instead of looking it up by name on every call
+    last_chain, chain_token = None, None
+    address = template.lower()
+
+    def inner(amount: CurrencyAmount, chain: Optional[Chain] = None, **kwargs) -> bool:
+        nonlocal last_chain, chain_token
+        if amount.currency.name == template:
+            return True
+        if chain:
+            if chain is not last_chain:
+                last_chain, chain_token = chain, getattr(chain, template, None)
+            if chain_token == amount.currency:
+                return True
+        if isinstance(amount, TokenAmount):
+            return amount.currency.address.lower() == address
+        return False
+    return inner
+
+
+def _filter_amount(template: str):
+    # parse the condition once, e.g. `> 0.01` or `<= $10`
+    found = _CONDITION_RE.match(template)
+    if found is None:
+        raise ValueError(f"Unsupported amount filter: `{template}`")
+    op, usd, value = found.groups()
+    try:
+        # any number literal, that python accepts, e.g. `1e-3` or `1_000`
+        threshold = float(value)
+    except ValueError:
+        raise ValueError(f"Unsupported amount filter: `{template}`") from None
+    compare, was_usd = _OPERATORS[op], bool(usd)
+
+    def inner(amount: CurrencyAmount, **kwargs) -> bool:
+        value = amount.to_fixed() if not was_usd else getattr(amount, 'usd_price', 0)
+        return compare(value, threshold)
+    return inner
+
+
+@lru_cache(maxsize=256)
+def _compile_template(template: str) -> Pattern:
+    # filters with the same template share one compiled pattern,
+    # `re` compiles it first, so re2 never accepts templates `re` rejects
+    pattern = re.compile(template)
+    if re2 is not None and not _RE_ONLY_SYNTAX_RE.search(template):
+        try:
+            return re2.compile(template, options=_RE2_OPTIONS)
+        except re2.error:
+            # e.g. backreferences or lookarounds, that only `re` supports
+            pass
+    return pattern
+
+
+@lru_cache(maxsize=512)
+def _parse_template(regexp: Pattern, template: str) -> Optional[Mapping[str, str]]:
+    # the same templates are parsed every time filters are created from the config,
+    # cached result is shared between callers, so it's returned read-only
+    found = regexp.match(template)
+    return MappingProxyType(found.groupdict()) if found is not None else None
+
+
+def _template_regexp_filter(template: Pattern):
+    match = template.match
+
+    def inner(line: str, **kwargs) -> bool:
+        return match(line) is not None
+    return inner
 
 
 class Filter:
@@ -66,16 +134,31 @@ class Filter:
         raise NotImplementedError
 
     def __call__(self, **kwargs: Any) -> Any:
+        filters = self._filters
+        if len(filters) == 1:
+            return bool(filters[0](**kwargs))
         # joined by AND condition
-        for flt in self._filters:
+        for flt in filters:
             if (not flt(**kwargs)):
                 return False
         return True
 
 
 class TemplateFilter(Filter):
+    def __init__(self, template: str) -> None:
+        # compile the template once, instead of looking it up on every line;
+        # wildcard matches any line, so there's nothing to check
+        self._pattern = _compile_template(template) if template != WILDCARD else None
+        super().__init__(template)
+
     def parse_filters(self, template: str) -> List[Callable[[List[Any]], bool]]:
-        return [_template_regexp_filter(template)]
+        if self._pattern is None:
+            return []
+        return [_template_regexp_filter(self._pattern)]
+
+    def filter_lines(self, lines: Iterable[str]) -> Iterable[str]:
+        """ Lazily filter many lines at once, without a Python call per line. """
+        return lines if self._pattern is None else filter(self._pattern.match, lines)
 
 
 class AmountFilter(Filter):
@@ -84,17 +167,17 @@ class AmountFilter(Filter):
         'token': _filter_token,
         'condition': _filter_amount
     }
-    regexp = re.compile(r"(?P<chain>[^:]+):(?P<token>[\w\d*]+)(?P<condition>.*$)")
+    regexp = re.compile(r"(?P<chain>[^:]+):(?P<token>[\w\d*]+)\s*(?P<condition>.*?)\s*$")
 
     def parse_filters(self, template: str) -> List[Callable[[List[Any]], bool]]:
-        found = self.regexp.search(template)
-        if found is None:
-            return[]
-        parsed = found.groupdict()
+        parsed = _parse_template(self.regexp, template)
+        if parsed is None:
+            return []
         return [
             filter_(value)
             for key, filter_ in self.filters_map.items()
-            if (value := parsed.get(key))
+            # wildcards match anything, so they're not checked at all
+            if (value := parsed.get(key)) and value != WILDCARD
         ]
 
 
@@ -109,11 +192,15 @@ class ChainTemplateLookup(Generic[T]):
 
     async def __call__(self, chains: List[Chain]) -> List[Tuple[T, Chain]]:
         chain_name, *route = self._template.split(':')
-        allowed_chains = [chain for chain in chains
-                          if _filter_chain(chain_name)(chain)]
-        tokens = await asyncio.gather(*[
-            self.get_item(chain, *route) for chain in allowed_chains
-        ])
+        chain_filter = _filter_chain(chain_name)
+        allowed_chains = [chain for chain in chains if chain_filter(chain)]
+        if len(allowed_chains) == 1:
+            # a template with exact chain name, so there's nothing to gather
+            tokens = [await self.get_item(allowed_chains[0], *route)]
+        else:
+            tokens = await asyncio.gather(*[
+                self.get_item(chain, *route) for chain in allowed_chains
+            ])
         return list(filter(None, tokens))
 
     async def get_item(self, chain, *route):
@@ -134,7 +221,7 @@ class TokenLookup(ChainTemplateLookup[Currency]):
         else:
             token = getattr(chain, token_name, None)
 
-        return None if not token else token, chain
+        return (token, chain) if token else None
 
 
 class ContractLookup(ChainTemplateLookup):
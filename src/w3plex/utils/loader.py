@@ -1,4 +1,6 @@
-from typing import Optional, Callable, NamedTuple, Union, TypeVar, overload, Generic, Unpack
+import asyncio
+from functools import partial
+from typing import Optional, Callable, NamedTuple, Union, TypeVar, overload, Generic, Unpack, List
 
 from w3ext import Account
 
@@ -6,6 +8,8 @@ from .filter import TemplateFilter
 from ..core import Loader, EntityConfig
 
 T = TypeVar("T")
+# large read buffer to load long lists of wallets with fewer syscalls
+READ_BUFFER_SIZE = 1 << 20
 
 class FileLoaderConfig(EntityConfig):
     file: str
@@ -18,16 +22,27 @@ class FileLoader(Generic[T], Loader[T, FileLoaderConfig]):
     async def process(self, fn: Optional[Callable[[Union[str, NamedTuple]], T]] = None) -> T:
         fn = fn or (lambda item: item)
 
-        flt = (TemplateFilter(_f) if (_f := self.config.get('filter')) is not None else
-               lambda line: True)
+        flt = TemplateFilter(_f) if (_f := self.config.get('filter')) is not None else None
 
-        with open(self.config['file'], 'r', encoding='utf-8-sig') as fr:
-            return [val for line in fr.readlines()
-                    if flt(line=line) and (val := self.process_line(line.strip(), fn)) is not None]
+        # read the file in a thread to not block the event loop
+        return await asyncio.to_thread(self._load_lines, flt, fn)
+
+    def _load_lines(
+        self, flt: Optional[TemplateFilter], fn: Callable[[Union[str, NamedTuple]], T]
+    ) -> List[T]:
+        with open(self.config['file'], 'r', encoding='utf-8-sig', buffering=READ_BUFFER_SIZE) as fr:
+            # strip and filter lines with builtins, to keep per line work out of Python code
+            lines = filter(None, map(str.strip, fr))
+            if flt is not None:
+                lines = flt.filter_lines(lines)
+            # bind line processing once, and call `fn` directly if it's not customized
+            process_line = (fn if type(self).process_line is FileLoader.process_line
+                            else partial(self.process_line, fn=fn))
+            return [val for val in map(process_line, lines) if val is not None]
 
     def process_line(self, line: str, fn: Callable[[Union[str, NamedTuple]], T]) -> T:
         return fn(line)
 
 
 def accounts_loader(**kwargs: Unpack[FileLoaderConfig]):
-    return lambda: FileLoader(**kwargs)(lambda item: Account.from_key(item))
\ No newline at end of file
+    return lambda: FileLoader(**kwargs)(Account.from_key)
\ No newline at end of file
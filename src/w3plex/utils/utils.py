@@ -1,3 +1,4 @@
+from functools import lru_cache
 from importlib import import_module
 from typing import Optional, Dict, TypeVar, Any, List, TYPE_CHECKING, Union
 
@@ -42,6 +43,7 @@ def execute_on_complete(fn, *args, **kwargs):
         app.add_complete_tasks(fn, *args, **kwargs)
 
 
+@lru_cache(maxsize=256)
 def load_path(path: str):
     parts = path.split(":")
     loaded = import_module(parts[0])
@@ -1,19 +1,21 @@
+import copy
 import os
-from typing import Dict, Optional
+import re
+from typing import Dict, List, Optional
 
 import ruamel.yaml as yaml
 from ruamel.yaml import comments
+from ruamel.yaml.events import (
+    CollectionEndEvent, CollectionStartEvent, MappingEndEvent, MappingStartEvent, ScalarEvent,
+)
+
+
+_HEX_RE = re.compile(r"0x[0-9a-fA-F]+")
 
 
 # Check if a string starts with '0x' and has valid hexadecimal digits afterwards
 def is_hex(value):
-    if not value.startswith("0x"):
-        return False
-    try:
-        int(value, 16)
-        return True
-    except ValueError:
-        return False
+    return _HEX_RE.fullmatch(value) is not None
 
 
 class Include:
@@ -26,25 +28,33 @@ class Loader(yaml.RoundTripLoader):
     """ Custom loader that supports !include directive. """
     def __init__(self, stream, *args, **kwargs):
         self._root = os.path.split(stream.name)[0]
+        # included files by absolute path, parsed once per config load
+        self._include_cache = {}
+        # loader for included files, set up once per config load
+        self._yaml_rt = yaml.YAML(typ='rt')
         super(Loader, self).__init__(stream, *args, **kwargs)
 
+    def _load_yaml(self, filename):
+        path = os.path.abspath(filename)
+        if path in self._include_cache:
+            # every include gets its own objects, as if the file was parsed again
+            return copy.deepcopy(self._include_cache[path])
+        with open(path, 'r') as f:
+            content = self._include_cache[path] = self._yaml_rt.load(f)
+        return content
+
     def include(self, node):
         if isinstance(node, yaml.ScalarNode):
             # For a file include
-            filename = os.path.join(self._root, self.construct_scalar(node))
-            with open(filename, 'r') as f:
-                return yaml.YAML(typ='rt').load(f)
+            return self._load_yaml(os.path.join(self._root, self.construct_scalar(node)))
         elif isinstance(node, yaml.MappingNode):
             # If specific parts of the file are to be included
             # Here we are creating a new CommentsMap, which is compatible with ruamel's requirements
             mapping = comments.CommentedMap()
             self.construct_mapping(node, maptyp=mapping, deep=True)
-            filename = os.path.join(self._root, mapping.get('file'))
+            full_content = self._load_yaml(os.path.join(self._root, mapping.get('file')))
             parts = mapping.get('items')
 
-            with open(filename, 'r') as f:
-                full_content = yaml.YAML(typ='rt').load(f)
-
             if parts is not None:
                 # Assuming parts need to be returned as a dict
                 return {part: full_content[part] for part in parts if part in full_content}
@@ -87,4 +97,62 @@ class Dumper(yaml.RoundTripDumper):
         return node
 
 Dumper.add_representer(str, Dumper.represent_hex_string)
-Dumper.add_representer(Include, Dumper.represent_include)
\ No newline at end of file
+Dumper.add_representer(Include, Dumper.represent_include)
+
+
+def _skip_node(event, events):
+    # consume all the events of the node started with ``event``
+    depth = 0
+    while True:
+        if isinstance(event, CollectionStartEvent):
+            depth += 1
+        elif isinstance(event, CollectionEndEvent):
+            depth -= 1
+        if depth == 0:
+            return
+        event = next(events)
+
+
+def _plain_key(event) -> str:
+    # merge keys, tagged and complex keys can't be read without
+    # constructing the mapping, so let the caller load it fully
+    if not isinstance(event, ScalarEvent) or event.tag is not None or event.value == '<<':
+        raise KeyError(getattr(event, 'value', None))
+    return event.value
+
+
+def load_mapping_keys(filename: str, key: str) -> List[str]:
+    """ Return keys of the top-level ``key`` mapping without loading the whole file.
+
+        The file is only parsed up to the end of the requested mapping, no values
+        are constructed and no files are included. ``KeyError`` is raised if
+        there's no such plain mapping in the file, or its keys can't be read
+        without loading it.
+    """
+    with open(filename) as fr:
+        events = yaml.YAML(typ='rt').parse(fr)
+        for event in events:
+            if isinstance(event, MappingStartEvent):
+                break
+        else:
+            raise KeyError(key)
+
+        for event in events:
+            if isinstance(event, MappingEndEvent):
+                break
+            name = _plain_key(event)
+            value = next(events)
+            if name != key:
+                _skip_node(value, events)
+                continue
+
+            if not isinstance(value, MappingStartEvent) or value.tag is not None:
+                # e.g. the whole mapping is included from another file
+                raise KeyError(key)
+            keys = []
+            for event in events:
+                if isinstance(event, MappingEndEvent):
+                    return keys
+                keys.append(_plain_key(event))
+                _skip_node(next(events), events)
+    raise KeyError(key)